@@ -1,15 +1,40 @@
 from flask import Flask, request, jsonify
+from flask.json.provider import DefaultJSONProvider
 from flask_migrate import Migrate
 from models import db, Event, Ticket
+from schemas import EventIn, TicketSale
 from config import Config
-from datetime import datetime
+from datetime import datetime, date
+from pydantic import ValidationError
+from sqlalchemy.exc import IntegrityError
+import orjson
+
+class OrjsonProvider(DefaultJSONProvider):
+    """JSON provider backed by orjson, which encodes in C and handles
+    date/datetime natively, so responses serialize several times faster
+    than with the stdlib json module
+    """
+
+    def dumps(self, obj, **kwargs) -> str:
+        return orjson.dumps(obj, default=self.default, option=orjson.OPT_NAIVE_UTC).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
 
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 app.config.from_object(Config)
 
 db.init_app(app)
 migrate = Migrate(app, db)
 
+# In debug mode raise on any N+1 the loader options fail to catch, so
+# a careless relationship access blows up in development, not in prod
+if app.debug:
+    from nplusone.ext.flask_sqlalchemy import NPlusOne
+    app.config['NPLUSONE_RAISE'] = True
+    NPlusOne(app)
+
 @app.route('/')
 def index():
     return "Welcome to the management tickets service"
@@ -31,41 +56,35 @@ def create_event() -> dict:
         _type_: Returns an object indicating that the Event was 
         created successfully
     """
-    data:dict          = request.get_json()
-    name:str           = data.get('name')
-    start_date_str:str = data['start_date']
-    end_date_str:str   = data['end_date']
-    total_tickets:int  = data['total_tickets']
-    
-    # Input Validation
-    if not all([name, start_date_str, end_date_str, total_tickets]):
-        return jsonify({"error": "Missing requeired fieds."}), 400
-    
-    #Convert the string input dates to a datetime object
+    # Input Validation, pydantic parses and checks the body in one pass
     try:
-        start_date = datetime.strptime(start_date_str, "%d/%m/%Y")
-        end_date   = datetime.strptime(end_date_str, "%d/%m/%Y")
-    except Exception as e:
-        return jsonify({f'error: {e}'}), 400
-    
-    if start_date.date() < datetime.now().date():
+        data = EventIn.model_validate_json(request.get_data())
+    except ValidationError as e:
+        return jsonify({"error": str(e)}), 400
+
+    if data.start_date < date.today():
         return jsonify({"error": "Start date must not be in the past."}), 400
-    if end_date.date() < start_date.date():
-        return jsonify({"error": "End date must not be before start date."}), 400
-    if not (1 <= total_tickets <= 300):
-        return jsonify({"error": "The number of total tickets must be between 1 and 300."}), 400
-
-    event = Event(
-        name=name,
-        start_date=start_date,
-        end_date=end_date,
-        total_tickets=total_tickets
-    )
-    
-    db.session.add(event)
-    db.session.commit()
-    
-    return jsonify({"message": "Event created successfully.", "event_id": event.id}), 200
+
+    # INSERT ... RETURNING folds the insert and the id fetch into one
+    # statement instead of an INSERT plus a SELECT for the new id, the
+    # CHECK constraints on events cover the remaining invariants
+    try:
+        event_id = db.session.execute(
+            db.insert(Event)
+            .values(
+                name=data.name,
+                start_date=data.start_date,
+                end_date=data.end_date,
+                total_tickets=data.total_tickets
+            )
+            .returning(Event.id)
+        ).scalar_one()
+        db.session.commit()
+    except IntegrityError as e:
+        db.session.rollback()
+        return jsonify({"error": f"{e.orig}"}), 400
+
+    return jsonify({"message": "Event created successfully.", "event_id": event_id}), 200
 
 # Update an event
 @app.route('/events/<int:event_id>', methods=['PUT'])
@@ -88,48 +107,28 @@ def update_event(event_id) -> dict:
         a successfully way.
     """
     #Get the event by id to update
-    event              = Event.query.get_or_404(event_id)
+    event = db.get_or_404(Event, event_id)
     #get the data from the request
-    data:dict          = request.get_json()
-    # set the data
-    name:str           = data['name']
-    start_date_str:str = data['start_date']
-    end_date_str:str   = data['end_date']
-    total_tickets:int  = data['total_tickets']
-    
-    if not all([name, start_date_str, end_date_str, total_tickets]):
-        return jsonify({"error": "Missing required fields."}), 400
-    
-    if name:
-        event.name = name
-        
-    if start_date_str:
-        try:
-            start_date = datetime.strptime(start_date_str, "%d/%m/%Y")
-        except Exception as e:
-            return jsonify({f"error":{e}}), 400
-        if start_date.date() < datetime.now().date():
-            return jsonify({"error": "The start date must not be in the past."}), 400
-        event.start_date = start_date
-    
-    if end_date_str:
-        try:
-            end_date = datetime.strptime(end_date_str, "%d/%m/%Y")
-        except Exception as e:
-            return jsonify({f"error":{e}}), 400
-        if end_date.date() < event.start_date.date():
-            return jsonify({"error": "End date must not be before start date."}), 400
-        
-        event.end_date = end_date
-        
-    if total_tickets is not None:
-        if total_tickets < event.tickets_sold:
-            return jsonify({"error": "You cannot reduce total tickets below tickets sold."}), 400
-        if not (1 <= total_tickets <= 300):
-            return jsonify({"error": "The total of tickets must be between 1 and 300."}), 400
-        event.total_tickets = total_tickets
-    
-    db.session.commit()
+    try:
+        data = EventIn.model_validate_json(request.get_data())
+    except ValidationError as e:
+        return jsonify({"error": str(e)}), 400
+
+    if data.start_date < date.today():
+        return jsonify({"error": "The start date must not be in the past."}), 400
+
+    event.name          = data.name
+    event.start_date    = data.start_date
+    event.end_date      = data.end_date
+    event.total_tickets = data.total_tickets
+
+    # The CHECK constraints reject a reversed date range or shrinking
+    # total_tickets below tickets_sold
+    try:
+        db.session.commit()
+    except IntegrityError as e:
+        db.session.rollback()
+        return jsonify({"error": f"{e.orig}"}), 400
     
     return jsonify({"message": "Event updated successfully."}), 200
 
@@ -146,9 +145,17 @@ def delete_event(event_id) -> dict:
         dict: an object indicating if the registry was deleted successfully
         or if you cant delete the registry
     """
-    event        = Event.query.get_or_404(event_id)
-    current_time = datetime.now()
-    
+    # Load the tickets together with the event, the delete-orphan cascade
+    # needs the collection and the relationship no longer lazy-loads
+    event = db.session.execute(
+        db.select(Event).options(db.selectinload(Event.tickets)).where(Event.id == event_id)
+    ).scalar_one_or_none()
+
+    if not event:
+        return jsonify({"error": "Event not found."}), 404
+
+    current_time = date.today()
+
     if event.tickets_sold > 0 and event.end_date > current_time:
         return jsonify({"error": "You can't delete an event with sold tickets or before it ends."}), 400
     
@@ -161,28 +168,53 @@ def delete_event(event_id) -> dict:
 @app.route('/events/<int:event_id>/sell', methods=['POST'])
 def sell_ticket(event_id) -> dict:
     """Function that allows you to make the process of
-    selling a ticket
+    selling tickets, you can send an optional body like this
+    to sell several tickets at once:
+    {
+    "quantity": 4
+}
 
     Args:
-        event_id (_type_):id that allows you to identify for which event 
-        you are going to sell a ticket
+        event_id (_type_):id that allows you to identify for which event
+        you are going to sell the tickets
 
     Returns:
-        dict: An object that tells you if the Ticket was sold in
+        dict: An object that tells you if the Tickets were sold in
         a successful way or if there was an error
     """
-    event = Event.query.get_or_404(event_id)
-    
-    if event.tickets_sold >= event.total_tickets:
+    try:
+        data = TicketSale.model_validate_json(request.get_data() or b'{}')
+    except ValidationError as e:
+        return jsonify({"error": str(e)}), 400
+
+    # Claim the tickets with a single conditional UPDATE, the WHERE
+    # guard enforces the capacity invariant in SQL so concurrent sells
+    # can't oversell without any read-check-write race
+    result = db.session.execute(
+        db.update(Event)
+        .where(Event.id == event_id, Event.tickets_sold + data.quantity <= Event.total_tickets)
+        .values(tickets_sold=Event.tickets_sold + data.quantity)
+    )
+
+    if result.rowcount == 0:
+        db.session.rollback()
+        if not db.session.get(Event, event_id):
+            return jsonify({"error": "Event not found."}), 404
         return jsonify({"error": "No more tickets available for this event."}), 400
-    
-    ticket = Ticket(event_id=event_id)
-    event.tickets_sold += 1
-    
-    db.session.add(ticket)
+
+    # Core insert, one multi-row statement covers the whole batch and a
+    # single-row write has no use for the ORM unit of work either
+    ticket_ids = db.session.execute(
+        db.insert(Ticket).returning(Ticket.id),
+        [{"event_id": event_id} for _ in range(data.quantity)]
+    ).scalars().all()
     db.session.commit()
-    
-    return jsonify({"message": "Ticket sold in a successfully way.", "ticket_id": ticket.event_id}), 201
+
+    return jsonify({
+        "message": "Ticket sold in a successfully way.",
+        "ticket_id": ticket_ids[0],
+        "ticket_ids": ticket_ids
+    }), 201
 
 # Redeem process
 @app.route('/tickets/<int:ticket_id>/redeem', methods=['POST'])
@@ -195,16 +227,37 @@ you can redeem a ticket for its ID
         _type_: An object that says if you redeemed the ticket sucsessfuly or 
         if you can't redeem the ticket
     """
-    ticket = Ticket.query.get_or_404(ticket_id)
+    # Fetch the ticket and its event in a single JOIN instead of letting
+    # the relationship lazy-load the event in a second query
+    ticket = db.session.execute(
+        db.select(Ticket).options(db.joinedload(Ticket.event)).where(Ticket.id == ticket_id)
+    ).scalar_one_or_none()
+
+    if not ticket:
+        return jsonify({"error": "Ticket not found."}), 404
+
     event = ticket.event
-    current_time = datetime.now()
-    
+    current_time = date.today()
+
     if ticket.redeemed:
         return jsonify({"error": "Ticket has already been redeemed."}), 400
-    if not (event.start_date.date() <= current_time.date() <= event.end_date.date()):
+    if not (event.start_date <= current_time <= event.end_date):
         return jsonify({"error": "Ticket can only be redeemed during the event's duration."}), 400
     
-    ticket.redeemed = True
+    # Conditional UPDATE so two concurrent redeems of the same ticket
+    # can't both pass the check above
+    result = db.session.execute(
+        db.update(Ticket)
+        .where(Ticket.id == ticket_id, Ticket.redeemed == False)
+        .values(redeemed=True)
+    )
+
+    if result.rowcount == 0:
+        db.session.rollback()
+        return jsonify({"error": "Ticket has already been redeemed."}), 400
+
+    # SQL-side increment so concurrent redeems don't lose updates
+    event.tickets_redeemed = Event.tickets_redeemed + 1
     db.session.commit()
     
     return jsonify({"message": "Ticket redeemed successfully."}), 200
@@ -220,20 +273,18 @@ def get_event_details(event_id) -> dict:
     Returns:
         dict: An object with all the data asociated to the event
     """
-    event = Event.query.get(event_id)
+    event = db.session.get(Event, event_id)
 
     if not event:
         return "Event not found", 404
 
-    tickets_redeemed = Ticket.query.filter_by(event_id=event_id, redeemed=True).count()
-
     event_details = {
         "name": event.name,
         "start_date": event.start_date,
         "end_date": event.end_date,
         "total_tickets": event.total_tickets,
         "tickets_sold": event.tickets_sold,
-        "tickets_redeemed": tickets_redeemed
+        "tickets_redeemed": event.tickets_redeemed
     }
 
     return event_details, 200
@@ -241,34 +292,39 @@ def get_event_details(event_id) -> dict:
 # Get all the registries
 @app.route('/events', methods=['GET'])
 def get_all_events() -> dict:
-    """Function that allows you to retrieve
-    all the events registered in the DB
+    """Function that allows you to retrieve the events registered
+    in the DB one page at a time, you can control the page with the
+    ?page= and ?per_page= query params (per_page is capped at 100)
 
     Returns:
-        dict: An object with all the registries
+        dict: An object with the requested page of registries
     """
-
-    events = Event.query.all()
-
-    if not events:
+    page:int     = max(request.args.get('page', 1, type=int), 1)
+    per_page:int = min(request.args.get('per_page', 50, type=int), 100)
+
+    # Select the columns directly, a pure-read endpoint has no use for
+    # full Event instances (object construction, identity map upkeep)
+    rows = db.session.execute(
+        db.select(
+            Event.id,
+            Event.name,
+            Event.start_date,
+            Event.end_date,
+            Event.total_tickets,
+            Event.tickets_sold,
+            Event.tickets_redeemed
+        )
+        .order_by(Event.id)
+        .limit(per_page)
+        .offset((page - 1) * per_page)
+    ).mappings().all()
+
+    if not rows:
         return "No events found", 404
 
-    all_events:list = []
-    for event in events:
-        tickets_redeemed = Ticket.query.filter_by(event_id=event.id, redeemed=True).count()
-
-        event_data = {
-            "id": event.id,
-            "name": event.name,
-            "start_date": event.start_date,
-            "end_date": event.end_date,
-            "total_tickets": event.total_tickets,
-            "tickets_sold": event.tickets_sold,
-            "tickets_redeemed": tickets_redeemed
-        }
-        all_events.append(event_data)
-
-    return {"events": all_events}, 200
+    return {"events": [dict(row) for row in rows], "page": page, "per_page": per_page}, 200
 
 if __name__ == '__main__':
-    app.run(debug=True)
+    # All the endpoints are I/O bound (SQLite + JSON), so serve each
+    # request in its own thread to let concurrent clients overlap DB I/O
+    app.run(debug=True, threaded=True)
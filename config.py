@@ -6,3 +6,11 @@ class Config:
     SECRET_KEY = os.environ.get('SECRET_KEY', 'popoca')
     SQLALCHEMY_DATABASE_URI = 'sqlite:///' + os.path.join(basedir, 'data', 'events.db')
     SQLALCHEMY_TRACK_MODIFICATIONS = False
+    # Keep a pool of long-lived connections so requests reuse warm SQLite
+    # page caches instead of paying connect overhead every time
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        'pool_size': 20,
+        'max_overflow': 10,
+        'pool_recycle': 1800,
+        'pool_pre_ping': True,
+    }
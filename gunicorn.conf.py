@@ -0,0 +1,8 @@
+import multiprocessing
+
+# Gevent workers monkey-patch sockets on startup, so each worker can
+# keep many I/O-bound requests in flight instead of one at a time
+bind = '0.0.0.0:5000'
+workers = multiprocessing.cpu_count()
+worker_class = 'gevent'
+worker_connections = 1000
@@ -0,0 +1,48 @@
+"""store event dates as Date columns
+
+Revision ID: a48ed510b7ef
+Revises: 1ebd6d0bf7a1
+Create Date: 2026-08-31 17:52:48.399547
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a48ed510b7ef'
+down_revision = '1ebd6d0bf7a1'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # An in-place alter_column would CAST the stored datetime text to DATE,
+    # which SQLite mangles into a number, so copy through temporary columns
+    op.add_column('events', sa.Column('start_date_tmp', sa.Date(), nullable=True))
+    op.add_column('events', sa.Column('end_date_tmp', sa.Date(), nullable=True))
+    op.execute("UPDATE events SET start_date_tmp = date(start_date), end_date_tmp = date(end_date)")
+    with op.batch_alter_table('events', schema=None) as batch_op:
+        batch_op.drop_column('start_date')
+        batch_op.drop_column('end_date')
+        batch_op.alter_column('start_date_tmp', new_column_name='start_date',
+               existing_type=sa.Date(),
+               nullable=False)
+        batch_op.alter_column('end_date_tmp', new_column_name='end_date',
+               existing_type=sa.Date(),
+               nullable=False)
+
+
+def downgrade():
+    op.add_column('events', sa.Column('start_date_tmp', sa.DateTime(), nullable=True))
+    op.add_column('events', sa.Column('end_date_tmp', sa.DateTime(), nullable=True))
+    op.execute("UPDATE events SET start_date_tmp = datetime(start_date), end_date_tmp = datetime(end_date)")
+    with op.batch_alter_table('events', schema=None) as batch_op:
+        batch_op.drop_column('start_date')
+        batch_op.drop_column('end_date')
+        batch_op.alter_column('start_date_tmp', new_column_name='start_date',
+               existing_type=sa.DateTime(),
+               nullable=False)
+        batch_op.alter_column('end_date_tmp', new_column_name='end_date',
+               existing_type=sa.DateTime(),
+               nullable=False)
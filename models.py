@@ -1,25 +1,61 @@
 from flask_sqlalchemy import SQLAlchemy
-from datetime import datetime
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from datetime import datetime, timezone
 
 db = SQLAlchemy()
 
+def _utcnow() -> datetime:
+    """Naive UTC timestamp for column defaults, UTC keeps the stored
+    times unambiguous no matter where the server runs
+    """
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+@event.listens_for(Engine, 'connect')
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Tune every new SQLite connection, WAL lets readers run
+    concurrently with a writer and the cache/mmap settings keep hot
+    pages in memory across pooled requests
+    """
+    cursor = dbapi_connection.cursor()
+    cursor.execute('PRAGMA journal_mode=WAL')
+    cursor.execute('PRAGMA synchronous=NORMAL')
+    cursor.execute('PRAGMA temp_store=MEMORY')
+    cursor.execute('PRAGMA mmap_size=268435456')
+    cursor.execute('PRAGMA cache_size=-65536')
+    cursor.close()
+
 class Event(db.Model):
     __tablename__ = 'events'
-    
+    # The DB enforces the immutable invariants, handlers only catch
+    # IntegrityError instead of re-checking them per request
+    __table_args__ = (
+        db.CheckConstraint('total_tickets BETWEEN 1 AND 300', name='ck_events_total_tickets_range'),
+        db.CheckConstraint('end_date >= start_date', name='ck_events_date_order'),
+        db.CheckConstraint('tickets_sold <= total_tickets', name='ck_events_not_oversold'),
+        db.CheckConstraint('tickets_sold >= 0', name='ck_events_sold_not_negative'),
+    )
+
     id = db.Column(db.Integer, primary_key=True)
     name = db.Column(db.String(100), nullable=False)
-    start_date = db.Column(db.DateTime, nullable=False)
-    end_date = db.Column(db.DateTime, nullable=False)
+    start_date = db.Column(db.Date, nullable=False)
+    end_date = db.Column(db.Date, nullable=False)
     total_tickets = db.Column(db.Integer, nullable=False)
     tickets_sold = db.Column(db.Integer, default=0, nullable=False)
+    tickets_redeemed = db.Column(db.Integer, default=0, nullable=False)
     
-    tickets = db.relationship('Ticket', backref='event', lazy=True, cascade="all, delete-orphan")
+    # lazy='raise' turns any accidental lazy load into a loud error, so every
+    # handler has to declare the loader strategy it needs at query time
+    tickets = db.relationship('Ticket', back_populates='event', lazy='raise', cascade="all, delete-orphan")
     
 class Ticket(db.Model):
     __tablename__ = 'tickets'
-    
+    __table_args__ = (db.Index('ix_tickets_event_redeemed', 'event_id', 'redeemed'),)
+
     id = db.Column(db.Integer, primary_key=True)
     event_id = db.Column(db.Integer, db.ForeignKey('events.id'), nullable=False)
     redeemed = db.Column(db.Boolean, default=False, nullable=False)
-    sold_at = db.Column(db.DateTime, default=datetime.now, nullable=False)
+    sold_at = db.Column(db.DateTime, default=_utcnow, nullable=False)
+
+    event = db.relationship('Event', back_populates='tickets', lazy='raise')
 
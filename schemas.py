@@ -0,0 +1,29 @@
+from datetime import date
+from pydantic import BaseModel, Field, field_validator
+
+class EventIn(BaseModel):
+    """Validated request body for the create and update event
+    endpoints, pydantic runs the checks in compiled code so this is
+    both faster and safer than poking at the raw dict by hand
+    """
+    name: str = Field(min_length=1)
+    start_date: date
+    end_date: date
+    total_tickets: int = Field(ge=1, le=300)
+
+    @field_validator('start_date', 'end_date', mode='before')
+    @classmethod
+    def _parse_ddmmyyyy(cls, value):
+        """Accept the DD/MM/YYYY format the API has always used, a
+        plain split is way cheaper than strptime
+        """
+        if isinstance(value, str) and value.count('/') == 2:
+            day, month, year = value.split('/')
+            return date(int(year), int(month), int(day))
+        return value
+
+class TicketSale(BaseModel):
+    """Optional body for the sell endpoint, an empty body keeps the
+    old one-ticket-per-request behaviour
+    """
+    quantity: int = Field(default=1, ge=1, le=300)
@@ -0,0 +1,50 @@
+# Point the app at an in-memory database before it is imported, the
+# engine is created as soon as the module loads
+import config
+
+config.Config.SQLALCHEMY_DATABASE_URI = 'sqlite://'
+config.Config.SQLALCHEMY_ENGINE_OPTIONS = {}
+
+from contextlib import contextmanager
+
+import pytest
+from sqlalchemy import event
+
+from app import app as flask_app
+from models import db
+
+
+@pytest.fixture
+def app():
+    flask_app.config['TESTING'] = True
+    with flask_app.app_context():
+        db.create_all()
+        yield flask_app
+        db.session.remove()
+        db.drop_all()
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+
+@contextmanager
+def count_queries():
+    """Record every SQL statement the engine executes so a test can
+    assert an upper bound and catch N+1 regressions
+
+    Yields:
+        list: the statements executed inside the block
+    """
+    queries: list = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        queries.append(statement)
+
+    engine = db.engine
+    event.listen(engine, 'before_cursor_execute', before_cursor_execute)
+    try:
+        yield queries
+    finally:
+        event.remove(engine, 'before_cursor_execute', before_cursor_execute)
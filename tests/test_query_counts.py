@@ -0,0 +1,90 @@
+from datetime import date, timedelta
+
+from conftest import count_queries
+from models import db, Event, Ticket
+
+
+def _seed_event(tickets:int = 0) -> int:
+    """Create an event running today with the given number of sold
+    tickets and return its id
+    """
+    event = Event(
+        name='Test event',
+        start_date=date.today(),
+        end_date=date.today() + timedelta(days=1),
+        total_tickets=10,
+        tickets_sold=tickets
+    )
+    db.session.add(event)
+    db.session.commit()
+
+    for _ in range(tickets):
+        db.session.add(Ticket(event_id=event.id))
+    db.session.commit()
+
+    return event.id
+
+
+def test_get_all_events_stays_two_queries(client):
+    for _ in range(5):
+        _seed_event(tickets=2)
+
+    with count_queries() as queries:
+        response = client.get('/events')
+
+    assert response.status_code == 200
+    assert len(response.json['events']) == 5
+    # One SELECT for the events, the per-event COUNT must not come back
+    assert len(queries) <= 2
+
+
+def test_get_all_events_paginates(client):
+    for _ in range(5):
+        _seed_event()
+
+    response = client.get('/events?page=2&per_page=2')
+
+    assert response.status_code == 200
+    assert response.json['page'] == 2
+    assert [event['id'] for event in response.json['events']] == [3, 4]
+
+
+def test_sell_ticket_query_count(client):
+    event_id = _seed_event()
+
+    with count_queries() as queries:
+        response = client.post(f'/events/{event_id}/sell')
+
+    assert response.status_code == 201
+    # Conditional UPDATE on the event plus the ticket INSERT
+    assert len(queries) <= 3
+
+
+def test_sell_tickets_in_batch(client):
+    event_id = _seed_event()
+
+    with count_queries() as queries:
+        response = client.post(f'/events/{event_id}/sell', json={'quantity': 4})
+
+    assert response.status_code == 201
+    assert len(response.json['ticket_ids']) == 4
+    # The whole batch still fits in the UPDATE plus one multi-row INSERT
+    assert len(queries) <= 3
+
+    response = client.post(f'/events/{event_id}/sell', json={'quantity': 7})
+    assert response.status_code == 400
+
+
+def test_redeem_ticket_query_count(client):
+    event_id = _seed_event(tickets=1)
+    ticket_id = db.session.execute(
+        db.select(Ticket.id).where(Ticket.event_id == event_id)
+    ).scalar_one()
+
+    with count_queries() as queries:
+        response = client.post(f'/tickets/{ticket_id}/redeem')
+
+    assert response.status_code == 200
+    # Joined SELECT of ticket+event, then the two conditional UPDATEs,
+    # no lazy load of the event may sneak back in
+    assert len(queries) <= 3